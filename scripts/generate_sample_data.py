@@ -24,18 +24,23 @@ Notes:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 
 import cv2
 import numpy as np
 
 from edge_vision.config import DEFAULT_INPUT_DIR
+from edge_vision.io_utils import save_image
 
 
 def _blank_canvas(width: int = 512, height: int = 512) -> np.ndarray:
     """Create a blank white canvas."""
 
-    return np.full((height, width, 3), 255, dtype=np.uint8)
+    canvas = np.empty((height, width, 3), dtype=np.uint8)
+    canvas.fill(255)
+    return canvas
 
 
 def generate_shapes_dataset(output_dir: Path) -> None:
@@ -48,26 +53,28 @@ def generate_shapes_dataset(output_dir: Path) -> None:
     """
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    tasks: List[Tuple[Path, np.ndarray]] = []
 
     # 1. Rectangles
     img_rect = _blank_canvas()
     cv2.rectangle(img_rect, (50, 50), (450, 200), (0, 0, 0), thickness=3)
     cv2.rectangle(img_rect, (100, 250), (400, 450), (0, 0, 255), thickness=-1)
-    cv2.imwrite(str(output_dir / "rectangles.png"), img_rect)
+    tasks.append((output_dir / "rectangles.png", img_rect))
 
     # 2. Circles
     img_circ = _blank_canvas()
     cv2.circle(img_circ, (256, 256), 150, (0, 0, 0), thickness=3)
     cv2.circle(img_circ, (256, 256), 75, (255, 0, 0), thickness=-1)
-    cv2.imwrite(str(output_dir / "circles.png"), img_circ)
+    tasks.append((output_dir / "circles.png", img_circ))
 
     # 3. Lines and grid
+    # All grid segments are drawn with a single polylines call (shape: N x 2 x 2)
     img_lines = _blank_canvas()
-    for x in range(50, 512, 50):
-        cv2.line(img_lines, (x, 50), (x, 462), (0, 0, 0), thickness=1)
-    for y in range(50, 512, 50):
-        cv2.line(img_lines, (50, y), (462, y), (0, 0, 0), thickness=1)
-    cv2.imwrite(str(output_dir / "grid.png"), img_lines)
+    vlines = np.array([[[x, 50], [x, 462]] for x in range(50, 512, 50)], dtype=np.int32)
+    hlines = vlines[:, :, ::-1]  # swap (x, y) to get the horizontal segments
+    segments = np.concatenate([vlines, hlines])
+    cv2.polylines(img_lines, segments, isClosed=False, color=(0, 0, 0), thickness=1)
+    tasks.append((output_dir / "grid.png", img_lines))
 
     # 4. Text
     img_text = _blank_canvas()
@@ -81,7 +88,7 @@ def generate_shapes_dataset(output_dir: Path) -> None:
         thickness=3,
         lineType=cv2.LINE_AA,
     )
-    cv2.imwrite(str(output_dir / "text.png"), img_text)
+    tasks.append((output_dir / "text.png", img_text))
 
     # 5. Mixed shapes
     img_mixed = _blank_canvas()
@@ -89,7 +96,12 @@ def generate_shapes_dataset(output_dir: Path) -> None:
     cv2.circle(img_mixed, (350, 150), 80, (0, 255, 0), thickness=-1)
     pts = np.array([[100, 300], [200, 450], [50, 450]], np.int32).reshape((-1, 1, 2))
     cv2.polylines(img_mixed, [pts], isClosed=True, color=(0, 0, 255), thickness=3)
-    cv2.imwrite(str(output_dir / "mixed.png"), img_mixed)
+    tasks.append((output_dir / "mixed.png", img_mixed))
+
+    # PNG encoding releases the GIL, so the files are written concurrently
+    # (save_image uses the fast PNG compression level from config).
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda task: save_image(task[1], task[0]), tasks))
 
 
 def main() -> None:
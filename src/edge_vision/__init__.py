@@ -19,11 +19,34 @@ from edge_vision import edge_detectors, io_utils, visualization
 
 Notes:
 - This file also defines the package-level version string.
+- On import, OpenCV's optimized code paths are enabled and its internal thread
+  pool is sized from `config.CV_THREADS` (default: one thread per CPU core).
+  When the CLI runs more than one worker, it calls `cv2.setNumThreads(1)`,
+  which turns off OpenCV's internal threading for the whole process so that
+  its threads do not compete with the worker pool.
 """
 
 from __future__ import annotations
 
-from . import edge_detectors, io_utils, visualization  # noqa: F401
+import os
+
+import cv2
+
+from . import config, edge_detectors, io_utils, visualization  # noqa: F401
+
+
+def _configure_opencv() -> None:
+    """Enable OpenCV optimizations and size its internal thread pool."""
+
+    try:
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(config.CV_THREADS or os.cpu_count() or 1)
+    except (AttributeError, cv2.error):
+        # Minimal or custom OpenCV builds may lack these controls
+        pass
+
+
+_configure_opencv()
 
 __all__ = ["edge_detectors", "io_utils", "visualization"]
 __version__ = "0.1.0"
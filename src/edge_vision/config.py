@@ -25,8 +25,40 @@ Notes:
 
 from __future__ import annotations
 
+import os
+import warnings
 from pathlib import Path
 
+
+def _env_int(name: str, default: int, minimum: int, maximum: int | None = None) -> int:
+    """Read a bounded integer from the environment.
+
+    The value must be at least `minimum` and, if given, at most `maximum`.
+    Invalid or out-of-range values emit a warning and fall back to `default`
+    so that a bad setting never prevents the package from importing.
+    """
+
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = None
+    valid = value is not None and value >= minimum
+    if valid and maximum is not None:
+        valid = value <= maximum
+    if not valid:
+        expected = f">= {minimum}" if maximum is None else f"in [{minimum}, {maximum}]"
+        warnings.warn(
+            f"Ignoring {name}={raw!r}: expected an integer {expected}; "
+            f"using {default}.",
+            stacklevel=2,
+        )
+        return default
+    return value
+
+
 # Base project directory (resolved at runtime from this file location)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -38,6 +70,15 @@ DEFAULT_OUTPUT_DIR = DEFAULT_DATA_DIR / "edges"
 # Allowed image extensions for discovery
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
 
+# Output encoding parameters used by `io_utils.save_image`. Edge maps are mostly
+# flat, so PNG level 1 yields similar file sizes while encoding much faster.
+PNG_COMPRESSION = _env_int("EDGE_VISION_PNG_COMPRESSION", 1, 0, 9)
+JPEG_QUALITY = 90
+
+# Number of threads OpenCV may use internally; 0 means one per CPU core.
+# Override with the EDGE_VISION_CV_THREADS environment variable.
+CV_THREADS = _env_int("EDGE_VISION_CV_THREADS", 0, 0)
+
 # Default parameters for edge detection algorithms
 CANNY_LOW_THRESHOLD = 100
 CANNY_HIGH_THRESHOLD = 200
@@ -45,6 +86,12 @@ CANNY_APERTURE_SIZE = 3
 CANNY_L2GRADIENT = True
 
 SOBEL_KSIZE = 3
+SOBEL_L1_APPROX = True
+# Sobel backend: "opencv" (default), "numba" (fused 3x3 kernel, needs numba) or
+# "torch" (batched 3x3 conv2d, needs PyTorch)
+SOBEL_BACKEND = os.environ.get("EDGE_VISION_BACKEND", "opencv").lower()
+# PyTorch device used by the "torch" backend, e.g. "cpu" or "cuda"
+TORCH_DEVICE = os.environ.get("EDGE_VISION_TORCH_DEVICE", "cpu")
 
 LAPLACIAN_KSIZE = 3
 LAPLACIAN_SCALE = 1
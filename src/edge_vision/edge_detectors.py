@@ -21,10 +21,15 @@ from edge_vision.edge_detectors import canny_edges, sobel_edges, laplacian_edges
 Notes:
 - Input images are converted to grayscale internally if needed.
 - Returned edge maps preserve the spatial resolution of the input.
+- Setting `EDGE_VISION_BACKEND=numba` routes 3x3 Sobel to a fused Numba kernel;
+  `EDGE_VISION_BACKEND=torch` uses PyTorch and enables batched CLI processing.
+- `canny_edges_gpu` runs Canny on a CUDA device when OpenCV is built with CUDA.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from typing import Tuple
 
 import cv2
@@ -32,6 +37,58 @@ import numpy as np
 
 from . import config
 
+# Maximum total size of the scratch buffers kept alive per thread. Larger
+# requests are allocated per call and released when the caller drops them.
+_BUFFER_CACHE_BYTES = 64 * 1024 * 1024
+_buffers = threading.local()
+
+
+def _scratch(tag: str, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Return a reusable per-thread buffer for intermediate results.
+
+    Batch workloads usually feed images of identical shape, so intermediate
+    arrays are recycled instead of being reallocated on every call. Buffers
+    are never returned to callers, and each thread owns its own cache. The
+    cache holds at most `_BUFFER_CACHE_BYTES`, evicting the least recently
+    used buffers first; a buffer bigger than the whole budget is not cached.
+
+    Parameters
+    ----------
+    tag:
+        Name distinguishing buffers of the same shape and dtype within a call.
+    shape:
+        Required buffer shape.
+    dtype:
+        Required buffer dtype.
+
+    Returns
+    -------
+    numpy.ndarray
+        Uninitialized array of the requested shape and dtype.
+    """
+
+    cache = getattr(_buffers, "cache", None)
+    if cache is None:
+        cache = _buffers.cache = OrderedDict()
+        _buffers.nbytes = 0
+
+    key = (tag, shape, np.dtype(dtype).str)
+    buf = cache.get(key)
+    if buf is not None:
+        cache.move_to_end(key)
+        return buf
+
+    buf = np.empty(shape, dtype=dtype)
+    if buf.nbytes > _BUFFER_CACHE_BYTES:
+        return buf
+
+    cache[key] = buf
+    _buffers.nbytes += buf.nbytes
+    while _buffers.nbytes > _BUFFER_CACHE_BYTES:
+        _, evicted = cache.popitem(last=False)
+        _buffers.nbytes -= evicted.nbytes
+    return buf
+
 
 def _to_grayscale(image: np.ndarray) -> np.ndarray:
     """Convert image to grayscale if it is BGR; otherwise return as-is.
@@ -54,12 +111,44 @@ def _to_grayscale(image: np.ndarray) -> np.ndarray:
     raise ValueError("Unsupported image shape for grayscale conversion: {shape}".format(shape=image.shape))
 
 
+def _sobel_numba(gray: np.ndarray, out: np.ndarray, l1: bool) -> np.ndarray:
+    """Run the fused Numba 3x3 Sobel magnitude kernel.
+
+    numba is imported lazily so that it stays an optional dependency.
+
+    Parameters
+    ----------
+    gray:
+        Grayscale uint8 image with shape (H, W).
+    out:
+        Preallocated uint16 array with shape (H, W) for the magnitude.
+    l1:
+        If True, use the L1 norm ``|gx| + |gy|`` instead of the L2 norm.
+
+    Returns
+    -------
+    numpy.ndarray
+        The `out` array, filled with the (rounded) gradient magnitude.
+    """
+
+    try:
+        from ._numba_kernels import sobel3x3_magnitude
+    except ImportError as exc:
+        raise ImportError(
+            "The 'numba' Sobel backend requires numba: pip install edge-vision[numba]"
+        ) from exc
+
+    sobel3x3_magnitude(np.ascontiguousarray(gray, dtype=np.uint8), out, l1)
+    return out
+
+
 def canny_edges(
     image: np.ndarray,
     low_threshold: int | float | None = None,
     high_threshold: int | float | None = None,
     aperture_size: int | None = None,
     l2gradient: bool | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Compute edges using the Canny detector.
 
@@ -77,6 +166,9 @@ def canny_edges(
     l2gradient:
         If True, use a more accurate L2 norm. Defaults to
         `config.CANNY_L2GRADIENT`.
+    out:
+        Optional preallocated uint8 array of shape (H, W) to write the edge
+        map into, so batch callers can reuse one buffer across images.
 
     Returns
     -------
@@ -91,11 +183,87 @@ def canny_edges(
     aperture = config.CANNY_APERTURE_SIZE if aperture_size is None else aperture_size
     l2 = config.CANNY_L2GRADIENT if l2gradient is None else l2gradient
 
-    edges = cv2.Canny(gray, threshold1=low, threshold2=high, apertureSize=aperture, L2gradient=l2)
-    return edges
+    # Positional call: (image, threshold1, threshold2, edges, apertureSize,
+    # L2gradient) skips keyword marshalling in the OpenCV binding.
+    return cv2.Canny(gray, float(low), float(high), out, int(aperture), bool(l2))
+
+
+def cuda_available() -> bool:
+    """Return True if OpenCV was built with CUDA and a CUDA device is present."""
+
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
 
-def sobel_edges(image: np.ndarray, ksize: int | None = None) -> np.ndarray:
+def create_cuda_canny_detector(
+    low_threshold: int | float | None = None,
+    high_threshold: int | float | None = None,
+    aperture_size: int | None = None,
+    l2gradient: bool | None = None,
+) -> cv2.cuda_CannyEdgeDetector:
+    """Create a CUDA Canny detector; defaults come from `config`.
+
+    A detector keeps its intermediate device buffers as members, so it must
+    not be used by two CUDA streams that may run concurrently. Create one
+    detector per stream instead.
+    """
+
+    low = config.CANNY_LOW_THRESHOLD if low_threshold is None else low_threshold
+    high = config.CANNY_HIGH_THRESHOLD if high_threshold is None else high_threshold
+    aperture = config.CANNY_APERTURE_SIZE if aperture_size is None else aperture_size
+    l2 = config.CANNY_L2GRADIENT if l2gradient is None else l2gradient
+
+    return cv2.cuda.createCannyEdgeDetector(
+        float(low), float(high), int(aperture), bool(l2)
+    )
+
+
+def canny_edges_gpu(
+    image: cv2.cuda_GpuMat,
+    detector: cv2.cuda_CannyEdgeDetector | None = None,
+    stream: cv2.cuda_Stream | None = None,
+) -> cv2.cuda_GpuMat:
+    """Compute Canny edges on the GPU using `cv2.cuda`.
+
+    Parameters
+    ----------
+    image:
+        Input image already uploaded to the device (BGR or grayscale). The
+        caller must keep it alive until `stream` has completed.
+    detector:
+        Detector from `create_cuda_canny_detector`, reused across calls on
+        the same stream. Defaults to a new detector with `config` parameters.
+    stream:
+        Optional CUDA stream to enqueue the work on. Defaults to the null
+        stream, which makes the call synchronous.
+
+    Returns
+    -------
+    cv2.cuda_GpuMat
+        Device-resident binary edge map (uint8) with values 0 or 255.
+    """
+
+    if stream is None:
+        stream = cv2.cuda.Stream_Null()
+    if detector is None:
+        detector = create_cuda_canny_detector()
+
+    if image.channels() == 3:
+        image = cv2.cuda.cvtColor(image, cv2.COLOR_BGR2GRAY, stream=stream)
+    elif image.channels() != 1:
+        raise ValueError(f"Unsupported channel count for Canny: {image.channels()}")
+
+    return detector.detect(image, stream=stream)
+
+
+def sobel_edges(
+    image: np.ndarray,
+    ksize: int | None = None,
+    l1_approx: bool | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """Compute edges using Sobel gradients (approximate gradient magnitude).
 
     Parameters
@@ -105,22 +273,126 @@ def sobel_edges(image: np.ndarray, ksize: int | None = None) -> np.ndarray:
     ksize:
         Size of the extended Sobel kernel; must be 1, 3, 5, or 7.
         Defaults to `config.SOBEL_KSIZE`.
+    l1_approx:
+        If True, use the cheap L1 magnitude ``|gx| + |gy|``; otherwise the
+        exact L2 norm (mirrors Canny's `L2gradient` choice). Defaults to
+        `config.SOBEL_L1_APPROX`.
+    out:
+        Optional preallocated uint8 array of shape (H, W) to write the edge
+        map into, so batch callers can reuse one buffer across images.
 
     Returns
     -------
     numpy.ndarray
-        Gradient magnitude edge map (uint8).
+        Gradient magnitude edge map (uint8), min-max normalized to [0, 255].
     """
 
     gray = _to_grayscale(image)
     k = config.SOBEL_KSIZE if ksize is None else ksize
+    l1 = config.SOBEL_L1_APPROX if l1_approx is None else l1_approx
+    shape = gray.shape
+
+    if config.SOBEL_BACKEND == "numba" and k == 3:
+        magnitude = _sobel_numba(gray, _scratch("mag", shape, np.uint16), l1)
+        return cv2.normalize(magnitude, out, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+
+    if config.SOBEL_BACKEND == "torch" and k == 3:
+        edges = sobel_edges_batch(gray[np.newaxis], l1_approx=l1)[0]
+        if out is None or out.shape != edges.shape or out.dtype != np.uint8:
+            return edges
+        np.copyto(out, edges)
+        return out
+
+    if l1 and k <= 5:
+        # For uint8 input and ksize <= 5, |gx| + |gy| is at most 24480 and fits in
+        # int16, which moves a quarter of the bytes of float64 gradients.
+        depth, dtype = cv2.CV_16S, np.int16
+    else:
+        depth, dtype = cv2.CV_32F, np.float32
+
+    grad_x = cv2.Sobel(gray, depth, 1, 0, dst=_scratch("gx", shape, dtype), ksize=k)
+    grad_y = cv2.Sobel(gray, depth, 0, 1, dst=_scratch("gy", shape, dtype), ksize=k)
+
+    if l1:
+        np.abs(grad_x, out=grad_x)
+        np.abs(grad_y, out=grad_y)
+        magnitude = np.add(grad_x, grad_y, out=grad_x)
+    else:
+        magnitude = _scratch("mag", shape, dtype)
+        magnitude = cv2.magnitude(grad_x, grad_y, magnitude=magnitude)
+    return cv2.normalize(magnitude, out, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+
+
+def sobel_edges_batch(
+    stack: np.ndarray,
+    l1_approx: bool | None = None,
+    device: str | None = None,
+) -> np.ndarray:
+    """Compute 3x3 Sobel edge maps for a stack of same-shaped images with PyTorch.
 
-    grad_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=k)
-    grad_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=k)
+    The whole stack is processed by a single `conv2d` call, which amortizes
+    per-image dispatch overhead. Results match `sobel_edges(image, ksize=3)`
+    up to rounding.
+
+    Parameters
+    ----------
+    stack:
+        Grayscale images with shape (N, H, W).
+    l1_approx:
+        Same as for `sobel_edges`. Defaults to `config.SOBEL_L1_APPROX`.
+    device:
+        PyTorch device to run on, e.g. ``"cpu"`` or ``"cuda"``. Defaults to
+        `config.TORCH_DEVICE`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Edge maps (uint8) with shape (N, H, W), each min-max normalized to
+        [0, 255] independently.
+    """
 
-    magnitude = cv2.magnitude(grad_x, grad_y)
-    magnitude = np.uint8(255 * magnitude / np.max(magnitude)) if np.max(magnitude) > 0 else np.zeros_like(gray, dtype=np.uint8)
-    return magnitude
+    try:
+        import torch
+        import torch.nn.functional as F
+    except ImportError as exc:
+        raise ImportError(
+            "sobel_edges_batch requires PyTorch: pip install edge-vision[torch]"
+        ) from exc
+
+    if stack.ndim != 3:
+        raise ValueError(f"Expected an (N, H, W) grayscale stack, got {stack.shape}")
+
+    l1 = config.SOBEL_L1_APPROX if l1_approx is None else l1_approx
+    device = config.TORCH_DEVICE if device is None else device
+    _, height, width = stack.shape
+
+    with torch.no_grad():
+        images = torch.from_numpy(np.ascontiguousarray(stack)).to(device)
+        images = images.unsqueeze(1).float()
+        # Reflect padding matches OpenCV's default BORDER_REFLECT_101. A single
+        # row or column has nothing to reflect, and OpenCV repeats it instead.
+        pad_w = "reflect" if width > 1 else "replicate"
+        pad_h = "reflect" if height > 1 else "replicate"
+        images = F.pad(images, (1, 1, 0, 0), mode=pad_w)
+        images = F.pad(images, (0, 0, 1, 1), mode=pad_h)
+
+        kx = torch.tensor(
+            [[-1.0, 0.0, 1.0], [-2.0, 0.0, 2.0], [-1.0, 0.0, 1.0]], device=device
+        )
+        kernels = torch.stack([kx, kx.t()]).unsqueeze(1)
+        grads = F.conv2d(images, kernels)
+
+        if l1:
+            magnitude = grads.abs().sum(dim=1)
+        else:
+            magnitude = grads.pow(2).sum(dim=1).sqrt()
+
+        lo = magnitude.amin(dim=(1, 2), keepdim=True)
+        hi = magnitude.amax(dim=(1, 2), keepdim=True)
+        scale = torch.where(hi > lo, 255.0 / (hi - lo), torch.zeros_like(hi))
+        edges = ((magnitude - lo) * scale).round().clamp(0, 255).to(torch.uint8)
+
+    return edges.cpu().numpy()
 
 
 def laplacian_edges(
@@ -128,6 +400,7 @@ def laplacian_edges(
     ksize: int | None = None,
     scale: int | float | None = None,
     delta: int | float | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """Compute edges using the Laplacian operator.
 
@@ -144,6 +417,9 @@ def laplacian_edges(
     delta:
         Optional delta value added to the results prior to storing them.
         Defaults to `config.LAPLACIAN_DELTA`.
+    out:
+        Optional preallocated uint8 array of shape (H, W) to write the edge
+        map into, so batch callers can reuse one buffer across images.
 
     Returns
     -------
@@ -157,8 +433,9 @@ def laplacian_edges(
     s = config.LAPLACIAN_SCALE if scale is None else scale
     d = config.LAPLACIAN_DELTA if delta is None else delta
 
-    lap = cv2.Laplacian(gray, cv2.CV_64F, ksize=k, scale=s, delta=d)
-    abs_lap = cv2.convertScaleAbs(lap)
+    lap = _scratch("lap", gray.shape, np.float64)
+    lap = cv2.Laplacian(gray, cv2.CV_64F, dst=lap, ksize=k, scale=s, delta=d)
+    abs_lap = cv2.convertScaleAbs(lap, dst=out)
     return abs_lap
 
 
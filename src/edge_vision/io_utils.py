@@ -15,23 +15,75 @@ Utility functions for safe and convenient image I/O operations, including
 recursive image discovery and robust read/write wrappers around OpenCV.
 
 Usage:
-from edge_vision.io_utils import list_images, load_image, save_image
+from edge_vision.io_utils import list_images, load_image, prefetch, save_image
 
 Notes:
 - All paths are handled using `pathlib.Path` for cross-platform compatibility.
 - `load_image` can optionally return grayscale images.
+- `prefetch` issues kernel readahead hints so disk I/O overlaps processing.
 """
 
 from __future__ import annotations
 
+import mmap
+import os
+import stat
+from collections import deque
 from pathlib import Path
-from typing import Iterable, List
+from typing import Deque, Iterable, Iterator, List
 
 import cv2
 import numpy as np
 
+from . import config
 from .config import ALLOWED_EXTENSIONS
 
+# Files at least this large are decoded from a memory map instead of cv2.imread
+_MMAP_THRESHOLD = 1 << 20
+
+# Extensions without the leading dot, for cheap comparison against file names
+_ALLOWED_SUFFIXES = frozenset(ext.lstrip(".").lower() for ext in ALLOWED_EXTENSIONS)
+
+
+def _stat_mode(path: Path) -> int:
+    """Return the `st_mode` of `path` from a single stat call, or 0 if missing."""
+
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _scan_images(base: Path, recursive: bool) -> Iterator[str]:
+    """Yield paths of image files under `base` using `os.scandir`.
+
+    `DirEntry` caches the file type reported by the directory listing, so
+    filtering needs no extra stat per entry and no `Path` object is built
+    for files that are filtered out.
+    """
+
+    root = os.fspath(base)
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except PermissionError:
+            # Like `Path.rglob`, skip unreadable subdirectories (but not `base`)
+            if directory == root:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                stem, dot, ext = entry.name.rpartition(".")
+                if not (dot and stem) or ext.lower() not in _ALLOWED_SUFFIXES:
+                    continue
+                if entry.is_file():
+                    yield entry.path
+
 
 def list_images(directory: Path | str, recursive: bool = False) -> List[Path]:
     """Return a list of image file paths under the given directory.
@@ -50,21 +102,93 @@ def list_images(directory: Path | str, recursive: bool = False) -> List[Path]:
     """
 
     base = Path(directory)
-    if not base.exists() or not base.is_dir():
+    if not stat.S_ISDIR(_stat_mode(base)):
         raise FileNotFoundError(f"Input directory not found or not a directory: {base}")
 
-    if recursive:
-        candidates: Iterable[Path] = base.rglob("*")
-    else:
-        candidates = base.iterdir()
-
-    images: List[Path] = [
-        p for p in candidates if p.is_file() and p.suffix.lower() in ALLOWED_EXTENSIONS
-    ]
+    images: List[Path] = [Path(p) for p in _scan_images(base, recursive)]
     images.sort()
     return images
 
 
+def _advise_willneed(path: Path) -> None:
+    """Ask the kernel to start reading `path` into the page cache.
+
+    This is a best-effort hint: it is silently skipped on platforms without
+    `os.posix_fadvise` (e.g. Windows, macOS) or when the file cannot be opened.
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def prefetch(paths: Iterable[Path | str], depth: int = 4) -> Iterator[Path]:
+    """Yield paths in order while reading ahead the next `depth` files.
+
+    Before a path is yielded, asynchronous kernel readahead has been requested
+    for it and for up to `depth` following paths. Disk reads therefore overlap
+    with the caller's decoding and processing of the current image, and
+    `load_image` mostly hits the page cache.
+
+    Parameters
+    ----------
+    paths:
+        Image paths, in processing order.
+    depth:
+        Number of upcoming files to read ahead.
+
+    Yields
+    ------
+    Path
+        The input paths, in their original order.
+    """
+
+    window: Deque[Path] = deque()
+    for path in paths:
+        p = Path(path)
+        _advise_willneed(p)
+        window.append(p)
+        if len(window) > depth:
+            yield window.popleft()
+    while window:
+        yield window.popleft()
+
+
+def _decode_mmap(path: Path, flag: int) -> np.ndarray | None:
+    """Decode an image straight from a read-only memory map of the file.
+
+    Decoding from the mapped page cache avoids copying the encoded bytes into
+    a userspace buffer first. Returns None on failure so that callers can fall
+    back to `cv2.imread`.
+    """
+
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+    except (OSError, ValueError):
+        return None
+
+    buf = None
+    try:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        return cv2.imdecode(buf, flag)
+    except cv2.error:
+        return None
+    finally:
+        # Release the exported buffer before closing the map, even on error
+        buf = None
+        mm.close()
+
+
 def load_image(path: Path | str, as_gray: bool = False) -> np.ndarray:
     """Load an image from disk using OpenCV.
 
@@ -82,11 +206,19 @@ def load_image(path: Path | str, as_gray: bool = False) -> np.ndarray:
     """
 
     p = Path(path)
-    if not p.exists() or not p.is_file():
+    try:
+        st = os.stat(p)
+    except (FileNotFoundError, NotADirectoryError):
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Image not found: {p}")
 
     flag = cv2.IMREAD_GRAYSCALE if as_gray else cv2.IMREAD_COLOR
-    img = cv2.imread(str(p), flag)
+    img = None
+    if os.name == "posix" and st.st_size >= _MMAP_THRESHOLD:
+        img = _decode_mmap(p, flag)
+    if img is None:
+        img = cv2.imread(str(p), flag)
 
     if img is None:
         raise ValueError(f"Failed to load image: {p}")
@@ -94,7 +226,11 @@ def load_image(path: Path | str, as_gray: bool = False) -> np.ndarray:
     return img
 
 
-def save_image(image: np.ndarray, path: Path | str) -> None:
+def save_image(
+    image: np.ndarray,
+    path: Path | str,
+    compression: int | None = None,
+) -> None:
     """Save an image to disk, creating parent directories as needed.
 
     Parameters
@@ -103,6 +239,9 @@ def save_image(image: np.ndarray, path: Path | str) -> None:
         Image array to save.
     path:
         Target path. Parent directories are created if they do not exist.
+    compression:
+        PNG compression level (0-9). Defaults to `config.PNG_COMPRESSION`.
+        Ignored for other formats; JPEG uses `config.JPEG_QUALITY`.
     """
 
     p = Path(path)
@@ -112,6 +251,20 @@ def save_image(image: np.ndarray, path: Path | str) -> None:
     if not isinstance(image, np.ndarray):
         raise TypeError("image must be a numpy.ndarray")
 
-    success = cv2.imwrite(str(p), image)
+    suffix = p.suffix.lower()
+    if suffix == ".png":
+        level = config.PNG_COMPRESSION if compression is None else compression
+        params = [cv2.IMWRITE_PNG_COMPRESSION, int(level)]
+    elif suffix in (".jpg", ".jpeg"):
+        params = [
+            cv2.IMWRITE_JPEG_QUALITY,
+            config.JPEG_QUALITY,
+            cv2.IMWRITE_JPEG_OPTIMIZE,
+            0,
+        ]
+    else:
+        params = []
+
+    success = cv2.imwrite(str(p), image, params)
     if not success:
         raise ValueError(f"Failed to save image to: {p}")
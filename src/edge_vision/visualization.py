@@ -11,23 +11,36 @@ License: MIT License (see LICENSE file for details)
 =========================================================================================================
 
 Description:
-Visualization helpers built on top of matplotlib. Provides convenience
-functions to display original and processed images side by side.
+Visualization helpers built on top of matplotlib (and a lightweight OpenCV
+window for quick inspection). Provides convenience functions to display
+original and processed images side by side.
 
 Usage:
 from edge_vision.visualization import show_side_by_side
 
 Notes:
 - Visualization is optional and mainly used for debugging and demos.
+- matplotlib is imported lazily so that importing this module stays cheap.
 """
 
 from __future__ import annotations
 
 from typing import Iterable, Tuple
 
-import matplotlib.pyplot as plt
+import cv2
 import numpy as np
 
+# Fixed margins replace `tight_layout`, which needs an extra renderer pass to
+# measure every artist before drawing.
+_SUBPLOTS_ADJUST = {
+    "left": 0.02,
+    "right": 0.98,
+    "top": 0.95,
+    "bottom": 0.02,
+    "hspace": 0.08,
+    "wspace": 0.03,
+}
+
 
 def _to_rgb(image: np.ndarray) -> np.ndarray:
     """Convert BGR or grayscale image to RGB for matplotlib display.
@@ -68,26 +81,64 @@ def show_side_by_side(
         Tuple of titles for the two subplots.
     """
 
-    fig, axes = plt.subplots(1, 2, figsize=(10, 4))
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 2, figsize=(10, 4), layout=None)
 
     orig_rgb = _to_rgb(original)
 
-    axes[0].imshow(orig_rgb, cmap=None if orig_rgb.ndim == 3 else "gray")
+    orig_cmap = None if orig_rgb.ndim == 3 else "gray"
+    axes[0].imshow(orig_rgb, cmap=orig_cmap, interpolation="nearest")
     axes[0].set_title(titles[0])
     axes[0].axis("off")
 
     if processed.ndim == 2:
-        axes[1].imshow(processed, cmap="gray")
+        axes[1].imshow(processed, cmap="gray", interpolation="nearest")
     else:
-        axes[1].imshow(_to_rgb(processed))
+        axes[1].imshow(_to_rgb(processed), interpolation="nearest")
 
     axes[1].set_title(titles[1])
     axes[1].axis("off")
 
-    fig.tight_layout()
+    fig.subplots_adjust(**_SUBPLOTS_ADJUST)
     plt.show()
 
 
+def _to_bgr(image: np.ndarray) -> np.ndarray:
+    """Convert grayscale image to BGR for OpenCV display; BGR is returned as-is."""
+
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    if image.ndim == 3 and image.shape[2] == 3:
+        return image
+    raise ValueError(f"Unsupported image shape for visualization: {image.shape}")
+
+
+def show_side_by_side_cv2(
+    original: np.ndarray,
+    processed: np.ndarray,
+    window_name: str = "edges",
+) -> None:
+    """Display original and processed images side by side in an OpenCV window.
+
+    Much faster to open than the matplotlib variant; blocks until a key is
+    pressed.
+
+    Parameters
+    ----------
+    original:
+        Original input image (BGR or grayscale).
+    processed:
+        Processed image (often an edge map) with the same height as `original`.
+    window_name:
+        Title of the OpenCV window.
+    """
+
+    cv2.imshow(window_name, cv2.hconcat([_to_bgr(original), _to_bgr(processed)]))
+    cv2.waitKey(0)
+    cv2.destroyWindow(window_name)
+
+
 def show_grid(images: Iterable[np.ndarray], cols: int = 3, titles: Iterable[str] | None = None) -> None:
     """Display a list of images in a grid.
 
@@ -101,6 +152,8 @@ def show_grid(images: Iterable[np.ndarray], cols: int = 3, titles: Iterable[str]
         Optional iterable of titles for each image.
     """
 
+    import matplotlib.pyplot as plt
+
     images = list(images)
     n = len(images)
     cols = max(1, cols)
@@ -113,7 +166,7 @@ def show_grid(images: Iterable[np.ndarray], cols: int = 3, titles: Iterable[str]
         if len(titles_list) != n:
             raise ValueError("Number of titles must match number of images")
 
-    fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3 * rows))
+    fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3 * rows), layout=None)
     if rows == 1 and cols == 1:
         axes = np.array([[axes]])
     elif rows == 1:
@@ -124,7 +177,8 @@ def show_grid(images: Iterable[np.ndarray], cols: int = 3, titles: Iterable[str]
         c = idx % cols
         ax = axes[r, c]
         img_rgb = _to_rgb(img)
-        ax.imshow(img_rgb, cmap=None if img_rgb.ndim == 3 else "gray")
+        cmap = None if img_rgb.ndim == 3 else "gray"
+        ax.imshow(img_rgb, cmap=cmap, interpolation="nearest")
         ax.set_title(title)
         ax.axis("off")
 
@@ -134,5 +188,5 @@ def show_grid(images: Iterable[np.ndarray], cols: int = 3, titles: Iterable[str]
         c = idx % cols
         axes[r, c].axis("off")
 
-    fig.tight_layout()
+    fig.subplots_adjust(**_SUBPLOTS_ADJUST)
     plt.show()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=========================================================================================================
+Project: Edge Detection using Computer Vision
+File: test_cli.py
+Author: Mobin Yousefi (GitHub: https://github.com/mobinyousefi-cs)
+Created: 2025-11-10
+Updated: 2025-11-10
+License: MIT License (see LICENSE file for details)
+=========================================================================================================
+
+Description:
+End-to-end tests for the command-line interface. The CLI is run in a
+subprocess so that hangs surface as timeouts instead of blocking the suite.
+
+Usage:
+pytest tests/test_cli.py
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import edge_vision
+from edge_vision.io_utils import list_images, load_image, save_image
+
+
+def _write_images(directory: Path, count: int, shape: tuple = (64, 64)) -> None:
+    rng = np.random.default_rng(0)
+    for idx in range(count):
+        save_image(
+            rng.integers(0, 256, size=shape, dtype=np.uint8), directory / f"{idx}.png"
+        )
+
+
+def _run_cli(*args: str, backend: str = "opencv") -> None:
+    env = dict(os.environ, EDGE_VISION_BACKEND=backend)
+    src_dir = str(Path(edge_vision.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    subprocess.run(
+        [sys.executable, "-m", "edge_vision.cli", *args],
+        env=env,
+        check=True,
+        timeout=120,
+    )
+
+
+def test_cli_numba_backend_with_several_workers(tmp_path: Path) -> None:
+    pytest.importorskip("numba")
+    _write_images(tmp_path / "in", 6)
+
+    _run_cli(
+        "--input",
+        str(tmp_path / "in"),
+        "--output",
+        str(tmp_path / "out"),
+        "--method",
+        "sobel",
+        "--workers",
+        "4",
+        backend="numba",
+    )
+    assert len(list_images(tmp_path / "out")) == 6
+
+
+def test_batched_sobel_bounds_buffering_and_writes_every_image(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from edge_vision import cli
+    from edge_vision.edge_detectors import sobel_edges
+
+    batches: list = []
+
+    def fake_batch(stack: np.ndarray, device: str) -> np.ndarray:
+        assert device == "cpu"
+        batches.append(stack.shape)
+        return np.stack([sobel_edges(image) for image in stack])
+
+    monkeypatch.setattr(cli, "sobel_edges_batch", fake_batch)
+    monkeypatch.setattr(cli, "_MIN_BATCH", 2)
+    monkeypatch.setattr(cli, "_MAX_BATCH", 4)
+
+    rng = np.random.default_rng(0)
+    shapes = [(16, 16), (24, 20), (16, 16), (32, 8), (16, 16), (24, 20), (16, 16)]
+    paths = []
+    for idx, shape in enumerate(shapes):
+        path = tmp_path / "in" / f"{idx}.png"
+        save_image(rng.integers(0, 256, size=shape, dtype=np.uint8), path)
+        paths.append(path)
+
+    cli._process_images_batched(paths, output_root=tmp_path / "out")
+
+    assert batches and all(n <= 4 for n, _, _ in batches)
+    assert [p.name for p in list_images(tmp_path / "out")] == sorted(
+        p.name for p in paths
+    )
+    for path in paths:
+        expected = sobel_edges(load_image(path, as_gray=True))
+        assert np.array_equal(
+            load_image(tmp_path / "out" / path.name, as_gray=True), expected
+        )
+
+
+@pytest.mark.parametrize("ksize, batched", [(3, True), (5, False)])
+def test_batched_sobel_only_for_3x3_kernels(
+    tmp_path: Path, monkeypatch, ksize: int, batched: bool
+) -> None:
+    from edge_vision import cli, config
+
+    calls: list = []
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "torch")
+    monkeypatch.setattr(config, "SOBEL_KSIZE", ksize)
+    monkeypatch.setattr(cli, "_process_images_batched", lambda *a, **k: calls.append(a))
+    monkeypatch.setattr(cli, "_process_image", lambda *a, **k: None)
+    _write_images(tmp_path / "in", 2)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "edge-vision",
+            "--input",
+            str(tmp_path / "in"),
+            "--output",
+            str(tmp_path / "out"),
+        ]
+        + ["--method", "sobel", "--workers", "1"],
+    )
+
+    cli.main()
+    assert bool(calls) == batched
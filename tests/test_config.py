@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=========================================================================================================
+Project: Edge Detection using Computer Vision
+File: test_config.py
+Author: Mobin Yousefi (GitHub: https://github.com/mobinyousefi-cs)
+Created: 2025-11-10
+Updated: 2025-11-10
+License: MIT License (see LICENSE file for details)
+=========================================================================================================
+
+Description:
+Tests for environment-variable overrides in the configuration module.
+
+Usage:
+pytest tests/test_config.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from edge_vision import config
+
+
+def test_env_int_reads_valid_value(monkeypatch) -> None:
+    monkeypatch.setenv("EDGE_VISION_PNG_COMPRESSION", "6")
+    assert config._env_int("EDGE_VISION_PNG_COMPRESSION", 1, 0, 9) == 6
+
+
+def test_env_int_uses_default_when_unset(monkeypatch) -> None:
+    monkeypatch.delenv("EDGE_VISION_PNG_COMPRESSION", raising=False)
+    assert config._env_int("EDGE_VISION_PNG_COMPRESSION", 1, 0, 9) == 1
+
+
+@pytest.mark.parametrize("raw", ["fast", "", "10", "-1", "1.5"])
+def test_env_int_falls_back_on_invalid_value(monkeypatch, raw: str) -> None:
+    monkeypatch.setenv("EDGE_VISION_PNG_COMPRESSION", raw)
+    with pytest.warns(UserWarning, match="EDGE_VISION_PNG_COMPRESSION"):
+        assert config._env_int("EDGE_VISION_PNG_COMPRESSION", 1, 0, 9) == 1
+
+
+@pytest.mark.parametrize("raw", ["auto", "-2"])
+def test_env_int_without_upper_bound_rejects_invalid_value(
+    monkeypatch, raw: str
+) -> None:
+    monkeypatch.setenv("EDGE_VISION_CV_THREADS", raw)
+    with pytest.warns(UserWarning, match="EDGE_VISION_CV_THREADS"):
+        assert config._env_int("EDGE_VISION_CV_THREADS", 0, 0) == 0
+
+
+def test_env_int_without_upper_bound_accepts_large_value(monkeypatch) -> None:
+    monkeypatch.setenv("EDGE_VISION_CV_THREADS", "64")
+    assert config._env_int("EDGE_VISION_CV_THREADS", 0, 0) == 64
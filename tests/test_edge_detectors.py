@@ -24,14 +24,23 @@ Notes:
 
 from __future__ import annotations
 
+import threading
+
+import cv2
 import numpy as np
+import pytest
 
+from edge_vision import config, edge_detectors
 from edge_vision.edge_detectors import (
     EDGE_METHODS,
     available_methods,
     canny_edges,
+    canny_edges_gpu,
+    create_cuda_canny_detector,
+    cuda_available,
     laplacian_edges,
     sobel_edges,
+    sobel_edges_batch,
 )
 
 
@@ -79,3 +88,199 @@ def test_edge_methods_registry_matches_functions() -> None:
         edges = func(img)
         assert edges.shape[:2] == img.shape[:2]
         assert edges.dtype == np.uint8
+
+
+def test_sobel_edges_constant_image_is_zero() -> None:
+    img = np.full((64, 64), 128, dtype=np.uint8)
+    edges = sobel_edges(img)
+    assert edges.dtype == np.uint8
+    assert not edges.any()
+
+
+def test_sobel_edges_uses_full_range() -> None:
+    edges = sobel_edges(_synthetic_image())
+    assert edges.min() == 0
+    assert edges.max() == 255
+
+
+@pytest.mark.parametrize("l1_approx", [True, False])
+def test_sobel_edges_matches_float64_reference(l1_approx: bool, monkeypatch) -> None:
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "opencv")
+
+    gray = cv2.cvtColor(_synthetic_image(), cv2.COLOR_BGR2GRAY)
+    grad_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
+    grad_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+    if l1_approx:
+        magnitude = np.abs(grad_x) + np.abs(grad_y)
+    else:
+        magnitude = cv2.magnitude(grad_x, grad_y)
+    expected = cv2.normalize(magnitude, None, 0, 255, cv2.NORM_MINMAX, cv2.CV_8U)
+
+    edges = sobel_edges(gray, ksize=3, l1_approx=l1_approx)
+    assert np.array_equal(edges, expected)
+
+
+@pytest.mark.parametrize(
+    "shape", [(128, 128), (37, 53), (1, 9), (9, 1), (2, 2), (1, 1)]
+)
+@pytest.mark.parametrize("l1_approx", [True, False])
+def test_sobel_numba_backend_matches_opencv(
+    shape: tuple, l1_approx: bool, monkeypatch
+) -> None:
+    pytest.importorskip("numba")
+
+    if shape == (128, 128):
+        gray = cv2.cvtColor(_synthetic_image(), cv2.COLOR_BGR2GRAY)
+    else:
+        gray = np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "opencv")
+    expected = sobel_edges(gray, ksize=3, l1_approx=l1_approx)
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "numba")
+    edges = sobel_edges(gray, ksize=3, l1_approx=l1_approx)
+
+    # Compared over the whole image, so the reflected borders are checked too
+    assert edges.shape == shape
+    assert edges.dtype == np.uint8
+    assert np.abs(edges.astype(int) - expected).max() <= 1
+
+
+def test_edge_maps_do_not_share_scratch_buffers() -> None:
+    img = _synthetic_image()
+    for func in EDGE_METHODS.values():
+        first = func(img)
+        second = func(img[::-1].copy())
+        assert not np.shares_memory(first, second)
+
+
+def test_scratch_cache_is_bounded_by_total_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(edge_detectors, "_BUFFER_CACHE_BYTES", 1000)
+    monkeypatch.setattr(edge_detectors, "_buffers", threading.local())
+
+    first = edge_detectors._scratch("a", (400,), np.uint8)
+    assert edge_detectors._scratch("a", (400,), np.uint8) is first
+    edge_detectors._scratch("b", (400,), np.uint8)
+    edge_detectors._scratch("c", (400,), np.uint8)
+    assert edge_detectors._buffers.nbytes <= 1000
+    assert edge_detectors._scratch("a", (400,), np.uint8) is not first
+
+    edge_detectors._scratch("big", (1001,), np.uint8)
+    cache = edge_detectors._buffers.cache
+    assert all(key[0] != "big" for key in cache)
+    assert sum(buf.nbytes for buf in cache.values()) == edge_detectors._buffers.nbytes
+
+
+def test_large_images_do_not_stay_in_scratch_cache(monkeypatch) -> None:
+    monkeypatch.setattr(edge_detectors, "_BUFFER_CACHE_BYTES", 64 * 1024)
+    monkeypatch.setattr(edge_detectors, "_buffers", threading.local())
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "opencv")
+
+    img = _synthetic_image(256, 256)
+    sobel_edges(img, l1_approx=False)
+    laplacian_edges(img)
+    assert edge_detectors._buffers.nbytes <= 64 * 1024
+
+
+def test_canny_edges_gpu_matches_cpu_shape() -> None:
+    if not cuda_available():
+        pytest.skip("OpenCV CUDA device not available")
+
+    img = _synthetic_image()
+    gpu_img = cv2.cuda_GpuMat()
+    gpu_img.upload(img)
+    edges = canny_edges_gpu(gpu_img).download()
+    assert edges.shape == img.shape[:2]
+    assert edges.dtype == np.uint8
+
+
+def test_canny_edges_gpu_per_stream_detectors_match_cpu() -> None:
+    if not cuda_available():
+        pytest.skip("OpenCV CUDA device not available")
+
+    gray = cv2.cvtColor(_synthetic_image(), cv2.COLOR_BGR2GRAY)
+    images = [gray, np.ascontiguousarray(gray.T)]
+    streams = [cv2.cuda_Stream() for _ in images]
+    jobs = []
+    for image, stream in zip(images, streams):
+        src = cv2.cuda_GpuMat()
+        src.upload(image, stream)
+        detector = create_cuda_canny_detector()
+        edges_gpu = canny_edges_gpu(src, detector=detector, stream=stream)
+        jobs.append((src, edges_gpu, edges_gpu.download(stream)))
+
+    for stream, image, (_, _, edges) in zip(streams, images, jobs):
+        stream.waitForCompletion()
+        assert edges.shape == image.shape
+        assert edges.dtype == np.uint8
+
+
+@pytest.mark.parametrize("l1_approx", [True, False])
+def test_sobel_edges_batch_matches_single_image(l1_approx: bool) -> None:
+    pytest.importorskip("torch")
+
+    gray = cv2.cvtColor(_synthetic_image(), cv2.COLOR_BGR2GRAY)
+    stack = np.stack([gray, gray.T.copy(), np.zeros_like(gray)])
+    edges = sobel_edges_batch(stack, l1_approx=l1_approx)
+
+    assert edges.shape == stack.shape
+    assert edges.dtype == np.uint8
+    for image, edge_map in zip(stack, edges):
+        expected = sobel_edges(image, ksize=3, l1_approx=l1_approx)
+        assert np.abs(edge_map.astype(int) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (1, 5), (5, 1), (2, 2), (2, 7)])
+@pytest.mark.parametrize("l1_approx", [True, False])
+def test_sobel_torch_backend_handles_thin_images(
+    shape: tuple, l1_approx: bool, monkeypatch
+) -> None:
+    pytest.importorskip("torch")
+
+    gray = np.random.default_rng(0).integers(0, 256, size=shape, dtype=np.uint8)
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "opencv")
+    expected = sobel_edges(gray, ksize=3, l1_approx=l1_approx)
+    monkeypatch.setattr(config, "SOBEL_BACKEND", "torch")
+    edges = sobel_edges(gray, ksize=3, l1_approx=l1_approx)
+
+    assert edges.shape == shape
+    assert np.abs(edges.astype(int) - expected).max() <= 1
+
+
+def test_sobel_edges_batch_ignores_visible_gpu_by_default(monkeypatch) -> None:
+    torch = pytest.importorskip("torch")
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    monkeypatch.setattr(config, "TORCH_DEVICE", "cpu")
+
+    gray = cv2.cvtColor(_synthetic_image(), cv2.COLOR_BGR2GRAY)
+    edges = sobel_edges_batch(gray[np.newaxis])
+    assert edges.shape == (1,) + gray.shape
+
+
+def test_canny_edges_default_path_matches_explicit_arguments() -> None:
+    img = _synthetic_image()
+    explicit = canny_edges(
+        img,
+        low_threshold=config.CANNY_LOW_THRESHOLD,
+        high_threshold=config.CANNY_HIGH_THRESHOLD,
+        aperture_size=config.CANNY_APERTURE_SIZE,
+        l2gradient=config.CANNY_L2GRADIENT,
+    )
+    assert np.array_equal(canny_edges(img), explicit)
+
+
+def test_canny_edges_reads_config_at_call_time(monkeypatch) -> None:
+    img = _synthetic_image()
+    monkeypatch.setattr(config, "CANNY_LOW_THRESHOLD", 5)
+    monkeypatch.setattr(config, "CANNY_HIGH_THRESHOLD", 10)
+    expected = cv2.Canny(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), 5, 10)
+    assert np.array_equal(canny_edges(img), expected)
+    assert np.array_equal(canny_edges(img, aperture_size=3), expected)
+
+
+def test_edge_methods_write_into_out_buffer() -> None:
+    img = _synthetic_image()
+    for func in EDGE_METHODS.values():
+        out = np.empty(img.shape[:2], dtype=np.uint8)
+        edges = func(img, out=out)
+        assert np.shares_memory(edges, out)
+        assert np.array_equal(edges, func(img))
@@ -20,12 +20,15 @@ pytest tests/test_io_utils.py
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
-from edge_vision.io_utils import list_images, load_image, save_image
+from edge_vision import io_utils
+from edge_vision.io_utils import list_images, load_image, prefetch, save_image
 
 
 @pytest.fixture()
@@ -57,3 +60,117 @@ def test_list_images_finds_saved_image(tmp_img_dir: Path) -> None:
     images = list_images(tmp_img_dir, recursive=False)
     assert len(images) == 1
     assert images[0].name == "a.png"
+
+
+def test_list_images_recursive_filters_extensions(tmp_img_dir: Path) -> None:
+    img = np.zeros((8, 8), dtype=np.uint8)
+    save_image(img, tmp_img_dir / "b.PNG")
+    save_image(img, tmp_img_dir / "nested" / "c.jpg")
+    (tmp_img_dir / "notes.txt").write_text("not an image")
+    (tmp_img_dir / "png").write_text("no extension")
+
+    top_level = list_images(tmp_img_dir, recursive=False)
+    assert [p.name for p in top_level] == ["b.PNG"]
+
+    everything = list_images(tmp_img_dir, recursive=True)
+    assert everything == [tmp_img_dir / "b.PNG", tmp_img_dir / "nested" / "c.jpg"]
+
+
+def test_save_image_png_compression_is_lossless(tmp_img_dir: Path) -> None:
+    img = np.zeros((64, 64), dtype=np.uint8)
+    img[16:48, 16:48] = 255
+
+    for level in (0, 1, 9):
+        img_path = tmp_img_dir / f"level{level}.png"
+        save_image(img, img_path, compression=level)
+        assert np.array_equal(load_image(img_path, as_gray=True), img)
+
+
+def test_prefetch_preserves_order(tmp_img_dir: Path) -> None:
+    paths = [tmp_img_dir / f"{idx}.png" for idx in range(6)]
+    for p in paths:
+        save_image(np.zeros((4, 4), dtype=np.uint8), p)
+    missing = tmp_img_dir / "missing.png"
+
+    assert list(prefetch(paths + [missing], depth=2)) == paths + [missing]
+    assert list(prefetch([], depth=2)) == []
+
+
+def test_load_large_image_roundtrip(tmp_img_dir: Path) -> None:
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, size=(1024, 1024), dtype=np.uint8)
+
+    img_path = tmp_img_dir / "large.png"
+    save_image(img, img_path)
+    assert img_path.stat().st_size >= 1 << 20
+
+    assert np.array_equal(load_image(img_path, as_gray=True), img)
+    assert load_image(img_path, as_gray=False).shape == (1024, 1024, 3)
+
+
+def test_load_large_image_falls_back_when_mmap_decode_fails(
+    tmp_img_dir: Path, monkeypatch
+) -> None:
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, size=(1024, 1024), dtype=np.uint8)
+    img_path = tmp_img_dir / "large.png"
+    save_image(img, img_path)
+
+    def imdecode(buf, flag):
+        raise cv2.error("decode failed")
+
+    monkeypatch.setattr(io_utils.cv2, "imdecode", imdecode)
+    assert io_utils._decode_mmap(img_path, cv2.IMREAD_GRAYSCALE) is None
+    assert np.array_equal(load_image(img_path, as_gray=True), img)
+
+
+def test_missing_paths_raise_file_not_found(tmp_img_dir: Path) -> None:
+    save_image(np.zeros((4, 4), dtype=np.uint8), tmp_img_dir / "a.png")
+
+    with pytest.raises(FileNotFoundError):
+        load_image(tmp_img_dir / "missing.png")
+    with pytest.raises(FileNotFoundError):
+        load_image(tmp_img_dir)
+    with pytest.raises(FileNotFoundError):
+        load_image(tmp_img_dir / "a.png" / "b.png")
+    with pytest.raises(FileNotFoundError):
+        list_images(tmp_img_dir / "a.png")
+    with pytest.raises(FileNotFoundError):
+        list_images(tmp_img_dir / "missing")
+
+
+def test_stat_permission_errors_are_not_reported_as_missing(
+    tmp_img_dir: Path, monkeypatch
+) -> None:
+    save_image(np.zeros((4, 4), dtype=np.uint8), tmp_img_dir / "a.png")
+
+    def stat(path, *args, **kwargs):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(io_utils.os, "stat", stat)
+    with pytest.raises(PermissionError):
+        load_image(tmp_img_dir / "a.png")
+    with pytest.raises(PermissionError):
+        list_images(tmp_img_dir)
+
+
+def test_list_images_recursive_skips_unreadable_subdirectories(
+    tmp_img_dir: Path, monkeypatch
+) -> None:
+    img = np.zeros((8, 8), dtype=np.uint8)
+    save_image(img, tmp_img_dir / "ok" / "a.png")
+    save_image(img, tmp_img_dir / "locked" / "b.png")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if Path(path).name == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(io_utils.os, "scandir", scandir)
+    assert list_images(tmp_img_dir, recursive=True) == [tmp_img_dir / "ok" / "a.png"]
+
+    # An unreadable base directory is still reported to the caller
+    with pytest.raises(PermissionError):
+        list_images(tmp_img_dir / "locked", recursive=True)